@@ -23,68 +23,119 @@ class ReadRadiologyConfig:
         string: strings of the file's various parameters.
     """
 
-    # List the parameters that reference the file's structure.
+    # List the parameters that reference the file's structure. These stay
+    # on the class, as the methods below use them as default arguments.
     FILE = 'config.ini'
     PATHS = 'file_paths'
     NAMES = 'dataset_column_names'
     PLOTS = 'output_plots'
     MISC = 'miscellaneous'
 
-    # List the parameters that references the file's dataset.
-    PATH_DATA = 'dataset'
-    PATH_PLOTS = 'output_plots'
-
-    # List the parameters that reference the dataset's column names.
-    SITE = 'aidoc_site'
-    ALGORITHM = 'algorithm'
-    CLASS = 'patient_class'
-    RESULT = 'aidoc_result'
-    TIME_WAIT = 'wait_time_minutes'
-    TIME_SA = 'study_aquistion_time'
-    TIME_CO = 'case_open_time'
-
-    # List the parameters that reference how plots are made.
-    COLOR_PT = 'color_point'
-    COLOR_BE = 'color_bar_edge'
-    HEIGHT = 'dimensions_height'
-    WIDTH = 'dimensions_width'
-    SIZE_TICK = 'label_size_tick'
-    SIZE_AXIS = 'label_size_axis'
-    LABEL = 'label_waittime'
-    LEGEND = 'legend_presence'
-    LWD = 'line_width'
-    FORMAT = 'output_format'
-    PAD = 'pad_from_axis_label_to_ticks'
-    ROTATION = 'tick_rotation'
-    BAR = 'type_barplot'
-    HIST = 'type_histogram'
-    BOX = 'type_boxplot'
-
-    # List the remaining miscellaneous parameters.
-    NEG = 'aidoc_result_negative'
-    POS = 'aidoc_result_positive'
-    BOOL = 'column_type_boolean'
-    CAT = 'column_type_categorical'
-    TRANS = 'column_transformed'
-    DT_SA = 'datetime_format_for_study_aquistion'
-    DT_CO = 'datetime_format_for_case_open'
-    DT_MO = 'datetime_format_month'
-    MONTH = 'datetime_month'
-    TIME = 'datetime_time'
-    SECONDS = 'datetime_seconds_in_regex'
+    # Hold one shared instance of the class per file, so that each file is
+    # only read once no matter how many scripts make use of it.
+    _instances = {}
 
     # Define the methods that allow for the processing of the file.
+    def __new__(cls, config_file=FILE):
+        if config_file not in cls._instances:
+            instance = super().__new__(cls)
+            instance._loaded = False
+            cls._instances[config_file] = instance
+        return cls._instances[config_file]
+
     def __init__(self, config_file=FILE):
+        if self._loaded:
+            return
         self.config_contents = config_file
 
+        # Hold the file's parameters once it has been read.
+        self._cache = {}
+
+        # List the parameters that references the file's dataset. These and
+        # the parameters below are assigned to the instance (rather than the
+        # class), so that all of the instance's attributes are set up front.
+        self.PATH_DATA = 'dataset'
+        self.PATH_PLOTS = 'output_plots'
+
+        # List the parameters that reference the dataset's column names.
+        self.SITE = 'aidoc_site'
+        self.ALGORITHM = 'algorithm'
+        self.CLASS = 'patient_class'
+        self.RESULT = 'aidoc_result'
+        self.TIME_WAIT = 'wait_time_minutes'
+        self.TIME_SA = 'study_aquistion_time'
+        self.TIME_CO = 'case_open_time'
+
+        # List the parameters that reference how plots are made.
+        self.COLOR_PT = 'color_point'
+        self.COLOR_BE = 'color_bar_edge'
+        self.HEIGHT = 'dimensions_height'
+        self.WIDTH = 'dimensions_width'
+        self.SIZE_TICK = 'label_size_tick'
+        self.SIZE_AXIS = 'label_size_axis'
+        self.LABEL = 'label_waittime'
+        self.LEGEND = 'legend_presence'
+        self.LWD = 'line_width'
+        self.FORMAT = 'output_format'
+        self.PAD = 'pad_from_axis_label_to_ticks'
+        self.ROTATION = 'tick_rotation'
+        self.BAR = 'type_barplot'
+        self.HIST = 'type_histogram'
+        self.BOX = 'type_boxplot'
+
+        # List the remaining miscellaneous parameters.
+        self.NEG = 'aidoc_result_negative'
+        self.POS = 'aidoc_result_positive'
+        self.BOOL = 'column_type_boolean'
+        self.CAT = 'column_type_categorical'
+        self.CAT_PD = 'column_type_categorical_pandas'
+        self.TRANS = 'column_transformed'
+        self.DT_SA = 'datetime_format_for_study_aquistion'
+        self.DT_CO = 'datetime_format_for_case_open'
+        self.DT_MO = 'datetime_format_month'
+        self.MONTH = 'datetime_month'
+        self.TIME = 'datetime_time'
+        self.FLOOR_CO = 'datetime_floor_for_case_open'
+
+    @classmethod
+    def get(cls, config_file=FILE):
+        """Get the shared instance of the class, with the file already read.
+
+        Args:
+            config_file (string): path of the configuration file to read.
+
+        Returns:
+            ReadRadiologyConfig: the shared, fully read instance for the file.
+        """
+
+        instance = cls(config_file)
+        instance.read_config()
+        return instance
+
     def read_config(self):
         """Read the file so that its parameters can be accessed.
         """
 
-        config_parser = configparser.ConfigParser()
+        # If the file has already been read, then there is no need to read
+        # it again.
+        if self._loaded:
+            return
+
+        # Use the "raw" parser, as no parameters refer to one another. This
+        # allows the datetime formats' "%" signs to be written unescaped.
+        config_parser = configparser.RawConfigParser()
         config_parser.read(self.config_contents)
         self.config_contents = config_parser
 
+        # Store every (header, key) pair in a dictionary, so that later
+        # parameter lookups do not need to go through the parser again.
+        self._cache = {
+            (header, key): value
+            for header in config_parser.sections()
+            for key, value in config_parser.items(header)
+        }
+        self._loaded = True
+
     def get_path(self, key, header=PATHS):
         """Get file parameters that relate to paths/directories.
 
@@ -96,7 +147,7 @@ class ReadRadiologyConfig:
             string: string of the parameter of interest.
         """
 
-        return self.config_contents.get(header, key)
+        return self._cache[(header, key)]
 
     def get_column_name(self, key, header=NAMES):
         """Get file parameters that relate to DataFrame column names.
@@ -109,7 +160,7 @@ class ReadRadiologyConfig:
             string: string of the parameter of interest.
         """
 
-        return self.config_contents.get(header, key)
+        return self._cache[(header, key)]
 
     def get_plot_param(self, key, header=PLOTS):
         """Get file parameters that relate to plot settings.
@@ -122,7 +173,7 @@ class ReadRadiologyConfig:
             string: string of the parameter of interest.
         """
 
-        return self.config_contents.get(header, key)
+        return self._cache[(header, key)]
 
     def get_misc(self, key, header=MISC):
         """Get file parameters that relate to miscellaneous settings.
@@ -135,4 +186,4 @@ class ReadRadiologyConfig:
             string: string of the parameter of interest.
         """
 
-        return self.config_contents.get(header, key)
+        return self._cache[(header, key)]
@@ -8,6 +8,7 @@ contains a docstring that describes it in more detail.
 
 # Import the libraries that will be used in this script.
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
@@ -15,25 +16,63 @@ from class_to_read_config import ReadRadiologyConfig
 
 # Interpret the configuration file that is associated with this script.
 # Keep the interpreter's name small ("cfg"), as it is frequently used.
-cfg = ReadRadiologyConfig()
-cfg.read_config()
+cfg = ReadRadiologyConfig.get()
+
+# Bind the parameters that are used by several functions once, so that
+# they do not need to be looked up again within each function.
+_X_LABEL_NICE = cfg.get_plot_param(cfg.LABEL)
+_HIST = cfg.get_plot_param(cfg.HIST)
+_BAR = cfg.get_plot_param(cfg.BAR)
+_BOX = cfg.get_plot_param(cfg.BOX)
+_PATH = cfg.get_path(cfg.PATH_PLOTS)
+_FMT = cfg.get_plot_param(cfg.FORMAT)
+_TIME_KW = cfg.get_misc(cfg.TIME)
+_SIZE_TICK = int(cfg.get_plot_param(cfg.SIZE_TICK))
+
+# Set the width * height dimensions of all plots.
+_PLOT_SIZE = (
+    int(cfg.get_plot_param(cfg.WIDTH)),
+    int(cfg.get_plot_param(cfg.HEIGHT))
+)
 
 
 # Define functions that relate to processing data.
+def convert_to_dt(df, colname, dt_format, dt_floor=None):
+    """Convert a pandas DataFrame column to the datetime data type.
+
+    Args:
+        df (pandas DataFrame): DataFrame containing the column.
+        colname (string): name of the DataFrame column with datetime info.
+        dt_format (string): format of the datetime info in the column.
+        dt_floor (string): unit of time (e.g., minute) to round the
+            datetime info down to, if any.
+
+    Returns:
+        pandas DataFrame: DataFrame with the column converted.
+    """
+
+    # Convert "colname" to the datetime type.
+    df[colname] = pd.to_datetime(df[colname], format=dt_format)
+
+    # Round the datetime info down to the chosen unit of time.
+    if dt_floor is not None:
+        df[colname] = df[colname].dt.floor(dt_floor)
+
+    return df
+
+
 def add_dt_to_df(
-        df, colname, dt_format,
+        df, colname,
         dt_mo=cfg.get_misc(cfg.MONTH),
         dt_mo_fmt=cfg.get_misc(cfg.DT_MO)):
     """Add datetime columns to a pandas DataFrame.
 
-    First convert a relevant string/categorical column to the
-    datetime data type, and then extract new columns from that column
-    that describe different scales of time (e.g., month).
+    Extract new columns from a column of the datetime data type that
+    describe different scales of time (e.g., month).
 
     Args:
         df (pandas DataFrame): DataFrame containing the columns.
         colname (string): name of the DataFrame column with datetime info.
-        dt_format (string): format of the datetime info in the column.
         dt_mo (string): reference of how to refer to a month.
         dt_mo_fmt (string): format to extract month from datetime info.
 
@@ -41,11 +80,24 @@ def add_dt_to_df(
         pandas DataFrame: DataFrame with datetime columns processed.
     """
 
-    # Convert "colname" to the datetime type.
-    df[colname] = pd.to_datetime(df[colname], format=dt_format)
-
-    # Extract new columns that describe different scales of time.
-    df[f'{colname}_{dt_mo}'] = df[colname].dt.strftime(dt_mo_fmt)
+    # Extract new columns that describe different scales of time. Common
+    # month formats are extracted directly from the datetime values, and
+    # only their categories are formatted as strings, so that their labels
+    # match the other formats. Any other format falls back to formatting
+    # each value as a string.
+    if dt_mo_fmt == '%m':
+        dt_mo_col = (
+            df[colname].dt.month.astype('category')
+            .cat.rename_categories('{:02d}'.format)
+        )
+    elif dt_mo_fmt == '%Y-%m':
+        dt_mo_col = (
+            df[colname].dt.to_period('M').astype('category')
+            .cat.rename_categories(lambda x: x.strftime(dt_mo_fmt))
+        )
+    else:
+        dt_mo_col = df[colname].dt.strftime(dt_mo_fmt)
+    df[f'{colname}_{dt_mo}'] = dt_mo_col
 
     return df
 
@@ -53,6 +105,9 @@ def add_dt_to_df(
 def add_list_item(list_of_lists, item):
     """Add the same item to each element of a list of lists.
 
+    The lists are extended in place, so the original list of lists is
+    modified and returned.
+
     Args:
         list_of_lists (list): list of lists to add an item to.
         item ([flexible type]): the item to add.
@@ -61,32 +116,18 @@ def add_list_item(list_of_lists, item):
         list: list of lists with the item added to each element.
     """
 
-    return [sublist+item for sublist in list_of_lists]
-
-
-# Define functions that relate to making visualizations.
-def set_plot_size(
-        plot_width=int(cfg.get_plot_param(cfg.WIDTH)),
-        plot_height=int(cfg.get_plot_param(cfg.HEIGHT))):
-    """Set the width * height dimensions of a plot.
-
-    Args:
-        plot_width (int): width of the plot.
-        plot_height (int): height of the plot.
+    for sublist in list_of_lists:
+        sublist.extend(item)
 
-    Returns:
-        tuple: paired width and height of a plot.
-    """
-
-    plot_size = (plot_width, plot_height)
-    return plot_size
+    return list_of_lists
 
 
+# Define functions that relate to making visualizations.
 def set_plot_axes(
         ax, label_x, label_y=None,
         label_size=int(cfg.get_plot_param(cfg.SIZE_AXIS)),
         label_pad=int(cfg.get_plot_param(cfg.PAD)),
-        tick_label_size=int(cfg.get_plot_param(cfg.SIZE_TICK)),
+        tick_label_size=_SIZE_TICK,
         tick_rotation=cfg.get_plot_param(cfg.ROTATION),
         legend_bool=cfg.get_plot_param(cfg.LEGEND) == 'True'):
     """Designate the settings and format of a plot's axes.
@@ -111,7 +152,7 @@ def set_plot_axes(
 
     # Set the format of the current plot's axis ticks.
     ax.tick_params(labelsize=tick_label_size)
-    plt.xticks(rotation=tick_rotation)
+    plt.setp(ax.get_xticklabels(), rotation=tick_rotation)
 
     # Determine whether or not a plot legend should be included.
     if not legend_bool:
@@ -122,14 +163,14 @@ def set_plot_axes(
 
 def plot_hist(
         plot_data,
-        x_label_nice=cfg.get_plot_param(cfg.LABEL),
-        plot_type=cfg.get_plot_param(cfg.HIST),
-        path=cfg.get_path(cfg.PATH_PLOTS),
-        plot_format=cfg.get_plot_param(cfg.FORMAT)):
+        x_label_nice=_X_LABEL_NICE,
+        plot_type=_HIST,
+        path=_PATH,
+        plot_format=_FMT):
     """Plot a histogram of a pandas DataFrame column with chosen settings.
 
     Args:
-        plot_data (pandas DataFrame): DataFrame containing the column.
+        plot_data (pandas Series): the DataFrame column to plot.
         x_label_nice (string): polished label for the plot's x-axis.
         plot_type (string): the type of plot being made (i.e., hist).
         path (string): the file path where the plot file will be saved.
@@ -137,27 +178,27 @@ def plot_hist(
     """
 
     # Designate the plot's file name.
-    plot_name = f'{plot_type}_{plot_data.columns[0]}'
+    plot_name = f'{plot_type}_{plot_data.name}'
 
-    # Remove any reference to previous plots, so that a new plot can be made.
-    plt.clf()
+    # Make a new figure for the plot, with the designated size.
+    fig, ax = plt.subplots(figsize=_PLOT_SIZE)
 
-    # Make the plot. Designate its size and the text and format of its axes.
-    plot_out = plot_data.plot.hist(figsize=set_plot_size())
+    # Make the plot. Designate the text and format of its axes.
+    plot_out = plot_data.plot.hist(ax=ax)
     plot_out = set_plot_axes(plot_out, x_label_nice)
 
-    # Save the plot as a file.
-    plot_out = plot_out.get_figure()
-    plot_out.savefig(f'{path}{plot_name}{plot_format}')
+    # Save the plot as a file, and then release the figure's memory.
+    fig.savefig(f'{path}{plot_name}{plot_format}')
+    plt.close(fig)
 
 
 def plot_bar(
         plot_data,
-        time_keyword=cfg.get_misc(cfg.TIME),
-        plot_type=cfg.get_plot_param(cfg.BAR),
+        time_keyword=_TIME_KW,
+        plot_type=_BAR,
         edge_color=cfg.get_plot_param(cfg.COLOR_BE),
-        path=cfg.get_path(cfg.PATH_PLOTS),
-        plot_format=cfg.get_plot_param(cfg.FORMAT)):
+        path=_PATH,
+        plot_format=_FMT):
     """Plot a bar plot of a pandas DataFrame column with chosen settings.
 
     Args:
@@ -170,10 +211,12 @@ def plot_bar(
     """
 
     # Determine the frequency of each category in the DataFrame column.
-    plot_data = plot_data.value_counts().to_frame()
+    # If the column contains datetime info, sort categories chronologically
+    # instead of by frequency.
+    is_time = time_keyword in plot_data.name
+    plot_data = plot_data.value_counts(sort=not is_time).to_frame()
 
-    # If the column contains datetime info, sort categories chronologically.
-    if time_keyword in plot_data.index.name:
+    if is_time:
         plot_data = plot_data.sort_index()
 
     # Designate the text of the plot's x-axis.
@@ -183,32 +226,27 @@ def plot_bar(
     # Designate the plot's file name.
     plot_name = f'{plot_type}_{x_label}'
 
-    # Remove any reference to previous plots, so that a new plot can be made.
-    plt.clf()
+    # Make a new figure for the plot, with the designated size.
+    fig, ax = plt.subplots(figsize=_PLOT_SIZE)
 
-    # Make the plot. Designate its size and the text and format of its axes.
-    plot_out = (
-        plot_data.plot.bar(
-            figsize=set_plot_size(),
-            edgecolor=edge_color
-        )
-    )
+    # Make the plot. Designate the text and format of its axes.
+    plot_out = plot_data.plot.bar(ax=ax, edgecolor=edge_color)
     plot_out = set_plot_axes(plot_out, x_label_nice)
 
-    # Save the plot as a file.
-    plot_out = plot_out.get_figure()
-    plot_out.savefig(f'{path}{plot_name}{plot_format}')
+    # Save the plot as a file, and then release the figure's memory.
+    fig.savefig(f'{path}{plot_name}{plot_format}')
+    plt.close(fig)
 
 
 def plot_box(
         plot_data,
-        time_keyword=cfg.get_misc(cfg.TIME),
-        plot_type=cfg.get_plot_param(cfg.BOX),
+        time_keyword=_TIME_KW,
+        plot_type=_BOX,
         line_width=int(cfg.get_plot_param(cfg.LWD)),
         point_color=cfg.get_plot_param(cfg.COLOR_PT),
-        legend_size=int(cfg.get_plot_param(cfg.SIZE_TICK)),
-        path=cfg.get_path(cfg.PATH_PLOTS),
-        plot_format=cfg.get_plot_param(cfg.FORMAT)):
+        legend_size=_SIZE_TICK,
+        path=_PATH,
+        plot_format=_FMT):
     """Plot a box plot of pandas DataFrame columns with chosen settings.
 
     Args:
@@ -244,12 +282,13 @@ def plot_box(
     # Designate the plot's file name.
     plot_name = f'{plot_type}_{x_label}'
 
-    # Remove any reference to previous plots, so that a new plot can be made.
-    plt.clf()
+    # Make a new figure for the plot, with the designated size.
+    fig, ax = plt.subplots(figsize=_PLOT_SIZE)
 
     # Make the plot. Designate the text and format of its axes and plot body.
     plot_out = sns.boxplot(
         data=plot_data,
+        ax=ax,
         x=x_label,
         y=y_label,
         hue=z_label,
@@ -262,8 +301,9 @@ def plot_box(
     if z_label is not None:
         plot_out.legend(fontsize=legend_size)
 
-    # Save the plot as a file.
-    plot_out.figure.savefig(f'{path}{plot_name}{plot_format}')
+    # Save the plot as a file, and then release the figure's memory.
+    fig.savefig(f'{path}{plot_name}{plot_format}')
+    plt.close(fig)
 
 
 # Define a function that performs a statistical significance test.
@@ -284,12 +324,17 @@ def perform_twosample_welch_ttest(df, column_name_cat, column_name_num):
         TtestResult object: object containing the outcomes of the test.
     """
 
-    # Determine the names of the categories that represent separate samples.
-    cats = df[column_name_cat].unique()
+    # Split the numeric column by the categories that represent separate
+    # samples, in a single pass over the categorical column.
+    samples = list(
+        df.groupby(column_name_cat, observed=True, sort=False)
+        [column_name_num]
+    )
 
-    # Designate the two samples to test.
-    test_sample_x = df.loc[df[column_name_cat] == cats[0], column_name_num]
-    test_sample_y = df.loc[df[column_name_cat] == cats[1], column_name_num]
+    # Designate the two samples to test. Test them in double precision,
+    # even if the numeric column is stored in single precision.
+    test_sample_x = samples[0][1].to_numpy(dtype=np.float64)
+    test_sample_y = samples[1][1].to_numpy(dtype=np.float64)
 
     # Perform the t-test and return the outputs. Note that "equal_var=False"
     # is what makes this a Welch's t-test specifically.
@@ -37,11 +37,30 @@ from class_to_read_config import ReadRadiologyConfig
 
 # Interpret the configuration file that is associated with this script.
 # Keep the interpreter's name small ("cfg"), as it is frequently used.
-cfg = ReadRadiologyConfig()
-cfg.read_config()
+cfg = ReadRadiologyConfig.get()
+
+# Read the radiology data file in as a Pandas DataFrame. Designate the
+# data types of the columns whose types are known ahead of time. The
+# boolean column is left to be inferred, as it contains missing values
+# that are removed further below.
+column_types = {
+    cfg.get_column_name(cfg.SITE): cfg.get_misc(cfg.CAT_PD),
+    cfg.get_column_name(cfg.ALGORITHM): cfg.get_misc(cfg.CAT_PD),
+    cfg.get_column_name(cfg.CLASS): cfg.get_misc(cfg.CAT_PD),
+    cfg.get_column_name(cfg.TIME_WAIT): np.float32
+}
+column_names_used = [
+    *column_types,
+    cfg.get_column_name(cfg.RESULT),
+    cfg.get_column_name(cfg.TIME_SA),
+    cfg.get_column_name(cfg.TIME_CO)
+]
 
-# Read the radiology data file in as a Pandas DataFrame.
-radiology_data = pd.read_csv(cfg.get_path(cfg.PATH_DATA))
+radiology_data = pd.read_csv(
+    cfg.get_path(cfg.PATH_DATA),
+    engine='pyarrow',
+    dtype=column_types
+)
 
 # Display the first few rows of the DataFrame.
 print(radiology_data.head())
@@ -61,12 +80,29 @@ print(radiology_data.isna().sum())
 # Remove the few DataFrame rows that contain missing values. Their
 # removal is warranted, as they constitute <0.3% of all rows, and
 # they are missing values from essential columns.
-radiology_data.dropna(inplace=True)
+radiology_data = radiology_data.dropna()
+
+# Now that the whole DataFrame has been checked and cleaned, keep only
+# the columns that are used in the rest of the analysis.
+radiology_data = radiology_data.drop(
+    columns=radiology_data.columns.difference(column_names_used)
+)
+
+# Remove any categories that no longer have rows after the removal above,
+# so that they are not counted in the plots and summaries further below.
+column_names_cat_pd = (
+    radiology_data
+    .select_dtypes(include=cfg.get_misc(cfg.CAT_PD))
+    .columns
+)
+
+for col in column_names_cat_pd:
+    radiology_data[col] = radiology_data[col].cat.remove_unused_categories()
 
 # For each numeric DataFrame column of interest, plot a histogram of
 # its values to view its distribution.
 column_names_num = cfg.get_column_name(cfg.TIME_WAIT)
-fn.plot_hist(radiology_data[column_names_num].to_frame())
+fn.plot_hist(radiology_data[column_names_num])
 
 # Transform skewed numeric DataFrame columns using the inverse
 # hyperbolic sine transformation. Verify that the transformations
@@ -76,46 +112,41 @@ radiology_data[column_names_trans] = (
     np.arcsinh(radiology_data[column_names_num])
 )
 fn.plot_hist(
-    radiology_data[column_names_trans].to_frame(),
+    radiology_data[column_names_trans],
     x_label_nice=(
         f'{cfg.get_plot_param(cfg.LABEL)} - {cfg.get_misc(cfg.TRANS).title()}'
     )
 )
 
-# Remove the "seconds" component of the case-open DataFrame column.
-# This makes the column more consistent with its study-acquisition
-# counterpart column, which does not contain seconds.
-(
-    radiology_data[cfg.get_column_name(cfg.TIME_CO)]
-    .replace(
-        {cfg.get_misc(cfg.SECONDS): ''},
-        regex=True,
-        inplace=True
-    )
-)
-
 # Convert the datetime columns in the DataFrame to the datetime type.
-# Then, derive categorical columns of interest from the datetime columns
-# that pertain to different scales of time (e.g., day, month, etc.).
+# Round the case-open column down to the minute, which removes its
+# "seconds" component. This makes the column more consistent with its
+# study-acquisition counterpart column, which does not contain seconds.
 column_names_dt = ([
     cfg.get_column_name(cfg.TIME_SA),
     cfg.get_column_name(cfg.TIME_CO)
 ])
 formats_dt = [cfg.get_misc(cfg.DT_SA), cfg.get_misc(cfg.DT_CO)]
+floors_dt = [None, cfg.get_misc(cfg.FLOOR_CO)]
 
 for counter, col in enumerate(column_names_dt):
-    radiology_data = fn.add_dt_to_df(radiology_data, col, formats_dt[counter])
+    radiology_data = fn.convert_to_dt(
+        radiology_data, col, formats_dt[counter], floors_dt[counter]
+    )
+
+# Derive categorical columns of interest from the datetime columns
+# that pertain to different scales of time (e.g., day, month, etc.).
+for col in column_names_dt:
+    radiology_data = fn.add_dt_to_df(radiology_data, col)
 
 # Convert the boolean DataFrame column of interest into a more
-# interpretable categorical column.
+# interpretable categorical column. The column's boolean values are used
+# directly as the codes of the categories (False = 0, True = 1).
 column_names_bool = cfg.get_column_name(cfg.RESULT)
 
-(
-    radiology_data[column_names_bool]
-    .replace({
-        True: cfg.get_misc(cfg.POS),
-        False: cfg.get_misc(cfg.NEG)
-    }, inplace=True)
+radiology_data[column_names_bool] = pd.Categorical.from_codes(
+    radiology_data[column_names_bool].to_numpy().astype(np.int8),
+    categories=[cfg.get_misc(cfg.NEG), cfg.get_misc(cfg.POS)]
 )
 
 # Re-display the first few rows of the DataFrame, now that manipulations
@@ -126,11 +157,12 @@ print(radiology_data.head())
 # rows are in each of its categories.
 column_names_cat = (
     radiology_data
-    .select_dtypes(include=cfg.get_misc(cfg.CAT))
+    .select_dtypes(include=[cfg.get_misc(cfg.CAT), cfg.get_misc(cfg.CAT_PD)])
     .columns
 )
 
-radiology_data[column_names_cat].apply(fn.plot_bar)
+for col in column_names_cat:
+    fn.plot_bar(radiology_data[col])
 
 # Plot boxplots that show how the numeric DataFrame columns of
 # interest vary across the categories of other columns.
@@ -138,19 +170,21 @@ column_names_boxplot = list(map(lambda x: [x], column_names_cat))
 
 column_names_boxplot = fn.add_list_item(
     column_names_boxplot,
-    [column_names_trans, cfg.get_column_name(cfg.RESULT)]
+    [column_names_trans, column_names_bool]
 )
 
-list(map(lambda x: fn.plot_box(radiology_data[x]), column_names_boxplot))
+for cols in column_names_boxplot:
+    fn.plot_box(radiology_data[cols])
 
 # Display relevant summary statistics across the DataFrame (change the
-# column names mentioned here as needed).
-print(radiology_data[cfg.get_column_name(cfg.TIME_WAIT)].describe())
+# column names mentioned here as needed). Compute them in double
+# precision, even though the numeric column is stored in single precision.
+print(radiology_data[column_names_num].astype(np.float64).describe())
 
 print(
-    radiology_data
-    .groupby(cfg.get_column_name(cfg.RESULT))
-    [cfg.get_column_name(cfg.TIME_WAIT)]
+    radiology_data[column_names_num]
+    .astype(np.float64)
+    .groupby(radiology_data[column_names_bool], observed=True)
     .describe()
 )
 
@@ -158,6 +192,6 @@ print(
 # (change the column names mentioned here as needed).
 print(
     fn.perform_twosample_welch_ttest(
-        radiology_data, cfg.get_column_name(cfg.RESULT), column_names_trans
+        radiology_data, column_names_bool, column_names_trans
     )
 )